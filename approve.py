@@ -3,6 +3,9 @@ Word of the Day Pipeline — Phase 3: Approval Gate & Social Distribution
 Requires: pip install instagrapi requests python-dotenv
 """
 
+import asyncio
+import errno
+import functools
 import glob
 import json
 import os
@@ -14,6 +17,11 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # stdlib json is fine, just slower
+    orjson = None
+
 load_dotenv()
 
 PROJECT_ROOT = Path(__file__).parent
@@ -22,22 +30,82 @@ DATA_BRIDGE = PROJECT_ROOT / "data_bridge.json"
 HANDOVER_MD = PROJECT_ROOT / "HANDOVER.md"
 ARCHIVE_DIR = PROJECT_ROOT / "permanent_archive"
 TEMP_DIR = PROJECT_ROOT / "temp"
+# Phase 2 intermediates (mirrors main.py); temp/wotd_cache/ is deliberately not listed
+TEMP_FILES = ("audio.mp3", "audio.m4a", "comfyui_raw.mp4")
+IG_SESSION_PATH = PROJECT_ROOT / ".ig_session.json"
+
+# TikTok chunk rules: chunks are 5–64 MB, small files go up as a single chunk, and
+# the final chunk absorbs the remainder (so it may be up to 2x TIKTOK_CHUNK_SIZE).
+TIKTOK_CHUNK_SIZE = 10 * 1024 * 1024
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 def find_latest_mp4() -> Path:
     """Find the most recently modified .mp4 in exports/."""
-    mp4s = sorted(EXPORTS_DIR.glob("*.mp4"), key=lambda p: p.stat().st_mtime, reverse=True)
-    if not mp4s:
+    with os.scandir(EXPORTS_DIR) as entries:
+        latest = max(
+            (e for e in entries if e.name.endswith(".mp4") and e.is_file()),
+            key=lambda e: e.stat().st_mtime,
+            default=None,
+        )
+    if latest is None:
         raise FileNotFoundError(f"No .mp4 files found in {EXPORTS_DIR}")
-    return mp4s[0]
+    return Path(latest.path)
+
+
+class FileSlice:
+    """Read-only window over bytes [start, start + length) of an open binary file.
+
+    Passed as a request body so the HTTP client streams the chunk straight from disk
+    in small blocks instead of materialising it in memory first.
+    """
+
+    def __init__(self, f, start: int, length: int):
+        self._f = f
+        self._start = start
+        self._length = length
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self._length - self._pos
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        self._f.seek(self._start + self._pos)
+        data = self._f.read(size)
+        self._pos += len(data)
+        return data
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._pos, os.SEEK_END: self._length}[whence]
+        self._pos = min(max(base + offset, 0), self._length)
+        return self._pos
+
+
+def tiktok_chunk_ranges(file_size: int) -> list[tuple[int, int]]:
+    """Split a file into inclusive (start, end) byte ranges following TikTok's chunk rules."""
+    count = max(file_size // TIKTOK_CHUNK_SIZE, 1)
+    ranges = [(i * TIKTOK_CHUNK_SIZE, (i + 1) * TIKTOK_CHUNK_SIZE - 1) for i in range(count - 1)]
+    ranges.append(((count - 1) * TIKTOK_CHUNK_SIZE, file_size - 1))
+    return ranges
+
+
+@functools.lru_cache(maxsize=4)
+def _load_json_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a JSON file; keyed on mtime so an edited file is re-read."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
 
 def load_data_bridge() -> dict:
-    """Load metadata from data_bridge.json."""
-    with open(DATA_BRIDGE, "r") as f:
-        return json.load(f)
+    """Load metadata from data_bridge.json (re-parsed only when the file changes)."""
+    return _load_json_cached(str(DATA_BRIDGE), DATA_BRIDGE.stat().st_mtime_ns)
 
 
 def build_caption(data: dict) -> str:
@@ -76,6 +144,23 @@ def approval_gate() -> Path:
 
 # ── 2. Social Media Distribution ─────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def http_session():
+    """Shared requests.Session so TikTok calls reuse pooled TCP/TLS connections.
+
+    Idempotent requests (the chunk PUTs) retry on transient gateway errors; the
+    init POST is never retried.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504], raise_on_status=False)
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry))
+    return session
+
+
 def upload_tiktok(video_path: Path, caption: str) -> bool:
     """
     Upload to TikTok via the Direct Post API (Content Posting API).
@@ -84,6 +169,7 @@ def upload_tiktok(video_path: Path, caption: str) -> bool:
     """
     import requests
 
+    http = http_session()
     token = os.getenv("TIKTOK_ACCESS_TOKEN")
     if not token or token.startswith("your_"):
         print("[TIKTOK] Skipped — TIKTOK_ACCESS_TOKEN not configured in .env")
@@ -97,6 +183,7 @@ def upload_tiktok(video_path: Path, caption: str) -> bool:
             "Content-Type": "application/json",
         }
         file_size = video_path.stat().st_size
+        chunk_ranges = tiktok_chunk_ranges(file_size)
         init_body = {
             "post_info": {
                 "title": caption[:150],
@@ -108,12 +195,12 @@ def upload_tiktok(video_path: Path, caption: str) -> bool:
             "source_info": {
                 "source": "FILE_UPLOAD",
                 "video_size": file_size,
-                "chunk_size": file_size,
-                "total_chunk_count": 1,
+                "chunk_size": chunk_ranges[0][1] + 1,
+                "total_chunk_count": len(chunk_ranges),
             },
         }
 
-        resp = requests.post(init_url, headers=headers, json=init_body, timeout=30)
+        resp = http.post(init_url, headers=headers, json=init_body, timeout=30)
         resp_data = resp.json()
 
         if resp.status_code == 401 or resp_data.get("error", {}).get("code") == "access_token_invalid":
@@ -128,19 +215,20 @@ def upload_tiktok(video_path: Path, caption: str) -> bool:
         upload_url = resp_data["data"]["upload_url"]
         publish_id = resp_data["data"]["publish_id"]
 
-        # Step 2: Upload the video file
+        # Step 2: Upload the video file chunk by chunk (TikTok requires sequential chunks)
         with open(video_path, "rb") as f:
-            video_data = f.read()
-
-        upload_headers = {
-            "Content-Type": "video/mp4",
-            "Content-Range": f"bytes 0-{file_size - 1}/{file_size}",
-        }
-        upload_resp = requests.put(upload_url, headers=upload_headers, data=video_data, timeout=120)
-
-        if upload_resp.status_code not in (200, 201):
-            print(f"[TIKTOK] Upload failed ({upload_resp.status_code}): {upload_resp.text}")
-            return False
+            for index, (start, end) in enumerate(chunk_ranges, 1):
+                chunk = FileSlice(f, start, end - start + 1)
+                upload_headers = {
+                    "Content-Type": "video/mp4",
+                    "Content-Range": f"bytes {start}-{end}/{file_size}",
+                }
+                upload_resp = http.put(upload_url, headers=upload_headers, data=chunk, timeout=120)
+
+                if upload_resp.status_code not in (200, 201, 206):
+                    print(f"[TIKTOK] Upload failed on chunk {index}/{len(chunk_ranges)} "
+                          f"({upload_resp.status_code}): {upload_resp.text}")
+                    return False
 
         print(f"[TIKTOK] Upload successful! Publish ID: {publish_id}")
         return True
@@ -150,6 +238,40 @@ def upload_tiktok(video_path: Path, caption: str) -> bool:
         return False
 
 
+def _instagram_client(username: str, password: str):
+    """Log in to Instagram, reusing the saved session in .ig_session.json when it is still valid."""
+    from instagrapi import Client
+    from instagrapi.exceptions import LoginRequired
+
+    cl = Client()
+    session_loaded = False
+    if IG_SESSION_PATH.exists():
+        try:
+            cl.load_settings(IG_SESSION_PATH)
+            session_loaded = True
+        except (OSError, ValueError) as e:
+            print(f"[INSTAGRAM] Saved session unreadable ({e}) — discarding it.")
+            IG_SESSION_PATH.unlink(missing_ok=True)
+            cl = Client()
+
+    if session_loaded:
+        try:
+            cl.login(username, password)
+            cl.get_timeline_feed()  # cheap probe: raises LoginRequired if the session expired
+        except LoginRequired:
+            print("[INSTAGRAM] Saved session expired — logging in fresh.")
+            # Keep the device UUIDs so Instagram sees the same device, not a new login
+            old_settings = cl.get_settings()
+            cl.set_settings({})
+            cl.set_uuids(old_settings["uuids"])
+            cl.login(username, password)
+    else:
+        cl.login(username, password)
+
+    cl.dump_settings(IG_SESSION_PATH)
+    return cl
+
+
 def upload_instagram(video_path: Path, caption: str) -> bool:
     """
     Upload a Reel to Instagram via instagrapi.
@@ -162,10 +284,7 @@ def upload_instagram(video_path: Path, caption: str) -> bool:
         return False
 
     try:
-        from instagrapi import Client
-
-        cl = Client()
-        cl.login(username, password)
+        cl = _instagram_client(username, password)
 
         media = cl.clip_upload(str(video_path), caption)
         print(f"[INSTAGRAM] Reel uploaded! Media ID: {media.pk}")
@@ -184,12 +303,29 @@ def upload_instagram(video_path: Path, caption: str) -> bool:
         return False
 
 
-def distribute(video_path: Path, caption: str) -> bool:
-    """Attempt uploads to configured platforms. Returns True if any succeeded."""
+async def distribute_async(video_path: Path, caption: str) -> dict:
+    """Run the platform uploads concurrently; each blocking uploader gets its own thread."""
+    platforms = {
+        "tiktok": upload_tiktok,
+        "instagram": upload_instagram,
+    }
+    outcomes = await asyncio.gather(
+        *(asyncio.to_thread(upload, video_path, caption) for upload in platforms.values()),
+        return_exceptions=True,
+    )
+
     results = {}
+    for name, outcome in zip(platforms, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"[DISTRIBUTE] {name} upload raised: {outcome}")
+            outcome = False
+        results[name] = outcome
+    return results
+
 
-    results["tiktok"] = upload_tiktok(video_path, caption)
-    results["instagram"] = upload_instagram(video_path, caption)
+def distribute(video_path: Path, caption: str) -> bool:
+    """Attempt uploads to configured platforms. Returns True if any succeeded."""
+    results = asyncio.run(distribute_async(video_path, caption))
 
     print(f"\n[DISTRIBUTE] Results: {results}")
 
@@ -209,18 +345,34 @@ def archive_video(video_path: Path) -> Path:
     dest_dir.mkdir(parents=True, exist_ok=True)
 
     dest_path = dest_dir / video_path.name
-    shutil.move(str(video_path), str(dest_path))
+    try:
+        os.replace(video_path, dest_path)  # same filesystem: atomic rename, no data copy
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(video_path), str(dest_path))  # archive lives on another volume
     print(f"[ARCHIVE] Moved {video_path.name} → {dest_path}")
     return dest_path
 
 
 def cleanup_temp():
-    """Wipe temp/ frames and audio files (mirrors CleanupManager from Phase 2)."""
-    if TEMP_DIR.is_dir():
-        shutil.rmtree(TEMP_DIR, ignore_errors=True)
-        print(f"[CLEANUP] Removed {TEMP_DIR}/")
-    else:
+    """Delete the Phase 2 temp files (mirrors main.cleanup()), keeping the WOTD day cache."""
+    if not TEMP_DIR.is_dir():
         print(f"[CLEANUP] {TEMP_DIR}/ already clean.")
+        return
+
+    for name in TEMP_FILES:
+        try:
+            (TEMP_DIR / name).unlink(missing_ok=True)
+        except OSError as e:
+            print(f"[CLEANUP] Could not remove {TEMP_DIR / name}: {e}")
+
+    try:
+        TEMP_DIR.rmdir()
+        print(f"[CLEANUP] Removed {TEMP_DIR}/")
+    except OSError:
+        # Still holds the WOTD day cache (or something unexpected) — leave it in place
+        print(f"[CLEANUP] Removed temp files; kept {TEMP_DIR}/ contents: {sorted(p.name for p in TEMP_DIR.iterdir())}")
 
 
 def _append_handover(content: str):
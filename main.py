@@ -5,19 +5,31 @@ Phase 2: TTS via ElevenLabs, Motion Canvas render, FFmpeg merge to final MP4.
 """
 
 import argparse
+import atexit
+import copy
+import functools
+import glob
 import json
+import logging
 import os
 import random
+import re
 import shutil
 import smtplib
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
 from email.mime.text import MIMEText
 from pathlib import Path
 
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright
-from playwright_stealth import Stealth
+
+try:
+    import orjson
+except ImportError:  # stdlib json is fine, just slower
+    orjson = None
 
 
 load_dotenv()
@@ -25,151 +37,325 @@ load_dotenv()
 WOTD_URL = "https://www.dictionary.com/e/word-of-the-day/"
 FALLBACK_PATH = "local_fallback.json"
 OUTPUT_PATH = "data_bridge.json"
+SCHEDULED_OUTPUT_PATTERN = "data_bridge_{day}.json"  # written by --batch, consumed on that day
+BATCH_POLL_INTERVAL = 60
 TEMP_DIR = "temp"
 AUDIO_PATH = os.path.join(TEMP_DIR, "audio.mp3")
+AUDIO_AAC_PATH = os.path.join(TEMP_DIR, "audio.m4a")
 EXPORTS_DIR = "exports"
 EXPORT_PATH = os.path.join(EXPORTS_DIR, "word_of_the_day.mp4")
 COMFYUI_URL = "http://127.0.0.1:8188"
+COMFYUI_WS_URL = "ws://127.0.0.1:8188"
 COMFYUI_WORKFLOW_PATH = "comfyui_workflow.json"
+COMFYUI_PROMPT_NODE = "1"  # CLIPTextEncode node holding the {{PROMPT_TEXT}} placeholder
 COMFYUI_VIDEO_PATH = os.path.join(TEMP_DIR, "comfyui_raw.mp4")
+WOTD_CACHE_DIR = os.path.join(TEMP_DIR, "wotd_cache")
+PW_PROFILE_DIR = ".pw_profile"  # outside temp/ so approve.py's cleanup doesn't wipe it
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Only the page HTML matters to the scraper; everything else is wasted bandwidth
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+_BLOCKED_HOST_MARKERS = ("google", "doubleclick")
+
+_LOG = logging.getLogger("wotd")
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WOTD_JSON_RE = re.compile(r'<script[^>]*\bid="json-current-wotd"[^>]*>(.+?)</script>', re.S)
+
+
+# ── JSON ─────────────────────────────────────────────────────────────────────
+
+def json_loads(data: bytes | str):
+    """Parse JSON via orjson when installed, else stdlib json."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (request bodies)."""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode("utf-8")
+
+
+def json_dumps_pretty(obj) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def read_json(path: str):
+    """Load a JSON file in one read."""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
 
 
 # ── Fetcher ──────────────────────────────────────────────────────────────────
 
+class SMTPPool:
+    """One lazily opened SMTP_SSL session reused across alerts; re-dials if the server dropped it."""
+
+    def __init__(self, host: str, port: int):
+        self._host = host
+        self._port = port
+        self._srv = None
+        self._lock = threading.Lock()
+
+    def _alive(self) -> bool:
+        try:
+            return self._srv.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def send(self, msg: MIMEText, user: str, password: str) -> None:
+        with self._lock:
+            if self._srv is not None and not self._alive():
+                self._srv = None
+            if self._srv is None:
+                srv = smtplib.SMTP_SSL(self._host, self._port, timeout=30)
+                srv.login(user, password)
+                self._srv = srv
+            self._srv.send_message(msg)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._srv is None:
+                return
+            try:
+                self._srv.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._srv = None
+
+
+_SMTP_POOL = SMTPPool("smtp.gmail.com", 465)
+atexit.register(_SMTP_POOL.close)
+
+
 def send_alert(subject: str, body: str) -> None:
     """Send an email alert via SMTP (Gmail). Fails silently if creds missing."""
     user = os.getenv("EMAIL_USER")
     password = os.getenv("EMAIL_PASS")
     recipient = os.getenv("RECIPIENT_EMAIL")
     if not all([user, password, recipient]):
-        print("[ALERT] Email creds not configured — skipping email alert.")
+        _LOG.warning("[ALERT] Email creds not configured — skipping email alert.")
         return
     msg = MIMEText(body)
     msg["Subject"] = subject
     msg["From"] = user
     msg["To"] = recipient
     try:
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(user, password)
-            server.send_message(msg)
-        print(f"[ALERT] Email sent to {recipient}")
+        _SMTP_POOL.send(msg, user, password)
+        _LOG.info(f"[ALERT] Email sent to {recipient}")
     except Exception as e:
-        print(f"[ALERT] Failed to send email: {e}")
+        _LOG.warning(f"[ALERT] Failed to send email: {e}")
 
 
 def load_fallback() -> dict:
     """Return a random entry from local_fallback.json."""
-    with open(FALLBACK_PATH, "r") as f:
-        entries = json.load(f)
+    entries = read_json(FALLBACK_PATH)
     entry = random.choice(entries)
-    print(f"[FALLBACK] Using local word: {entry['word']}")
+    _LOG.warning(f"[FALLBACK] Using local word: {entry['word']}")
     return entry
 
 
+def _pad_defs(definitions: list, word: str) -> list:
+    """Pad or trim scraped definitions to exactly 3 entries."""
+    pad = f"Used in context: The word '{word}' enriches any sentence."
+    return (definitions + [pad, pad, pad])[:3]
+
+
+def parse_wotd_json(wotd_data: dict) -> dict:
+    """Turn Dictionary.com's embedded WOTD JSON into {word, phonetic, definitions}."""
+    word = wotd_data["headword"].strip().lower()
+    phonetic_html = wotd_data.get("pronunciation", {}).get("phonetic", {}).get("html", "")
+    phonetic = f"[{_TAG_RE.sub('', phonetic_html)}]" if phonetic_html else ""
+    definition = wotd_data.get("definition", "")
+    pos = wotd_data.get("partOfSpeech", "")
+    definitions = []
+    if pos and definition:
+        definitions.append(f"({pos}) {definition}")
+    elif definition:
+        definitions.append(definition)
+
+    # Grab example sentence and explanation from top-level JSON fields
+    example_html = wotd_data.get("exampleSentence", "")
+    if example_html:
+        example = _TAG_RE.sub('', example_html).strip()
+        definitions.append(f"Example: {example}")
+    body_html = wotd_data.get("body", "")
+    if body_html:
+        explanation = _TAG_RE.sub('', body_html).strip()
+        definitions.append(explanation)
+
+    return {"word": word, "phonetic": phonetic, "definitions": _pad_defs(definitions, word)}
+
+
+def fetch_wotd_http() -> dict | None:
+    """
+    Fast path: plain HTTPS GET + regex for the server-rendered WOTD JSON, no browser.
+    Returns None if the page has no embedded JSON (e.g. a Cloudflare challenge).
+    """
+    import httpx
+
+    resp = httpx.get(WOTD_URL, headers={"User-Agent": USER_AGENT}, timeout=15, follow_redirects=True)
+    resp.raise_for_status()
+
+    match = _WOTD_JSON_RE.search(resp.text)
+    if not match:
+        return None
+
+    word_data = parse_wotd_json(json_loads(match.group(1)))
+    _LOG.info(f"[FETCHER] Scraped (HTTP): {word_data['word']} ({word_data['phonetic']}), "
+              f"{len(word_data['definitions'])} definitions")
+    return word_data
+
+
+def _route_filter(route) -> None:
+    """Abort images/media/fonts/CSS and ad/analytics requests; let everything else through."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        marker in request.url for marker in _BLOCKED_HOST_MARKERS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def fetch_wotd_playwright() -> dict:
+    """Scrape Dictionary.com WOTD with headless Chromium + stealth (Cloudflare fallback)."""
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.sync_api import sync_playwright
+    from playwright_stealth import Stealth
+
+    with sync_playwright() as p:
+        # A persistent profile keeps V8 code cache, HTTP cache and Cloudflare cookies between runs
+        context = p.chromium.launch_persistent_context(
+            user_data_dir=PW_PROFILE_DIR,
+            headless=True,
+            user_agent=USER_AGENT,
+            args=["--disable-blink-features=AutomationControlled", "--disable-dev-shm-usage"],
+        )
+        stealth = Stealth()
+        stealth.apply_stealth_sync(context)
+        context.route("**/*", _route_filter)
+        page = context.new_page()
+        page.goto(WOTD_URL, wait_until="commit", timeout=30000)
+        try:
+            # Proceed as soon as either strategy's anchor element is in the DOM
+            page.wait_for_selector("script#json-current-wotd, a.wotd-entry-headword",
+                                   state="attached", timeout=5000)
+        except PlaywrightTimeoutError:
+            _LOG.warning("[FETCHER] WOTD elements not found within 5s — trying selectors anyway")
+
+        # Strategy 1: Parse the embedded JSON data (most reliable)
+        json_el = page.query_selector("script#json-current-wotd")
+        if json_el:
+            wotd_data = json_loads(json_el.inner_text())
+            context.close()
+
+            word_data = parse_wotd_json(wotd_data)
+            _LOG.info(f"[FETCHER] Scraped (JSON): {word_data['word']} ({word_data['phonetic']}), "
+                      f"{len(word_data['definitions'])} definitions")
+            return word_data
+
+        # Strategy 2: DOM scraping fallback with current selectors
+        word_el = page.query_selector("a.wotd-entry-headword")
+        if not word_el:
+            raise ValueError("Could not locate WOTD heading element")
+        word = word_el.inner_text().strip().lower()
+
+        phonetic = ""
+        phonetic_el = page.query_selector("p.wotd-entry-phonetics")
+        if phonetic_el:
+            phonetic = phonetic_el.inner_text().strip()
+
+        definitions = []
+        def_el = page.query_selector("p.wotd-entry-definition")
+        pos_el = page.query_selector("div.wotd-entry-pos")
+        if def_el:
+            pos = pos_el.inner_text().strip() if pos_el else ""
+            defn = def_el.inner_text().strip()
+            definitions.append(f"({pos}) {defn}" if pos else defn)
+
+        example_el = page.query_selector("p.wotd-entry-example")
+        if example_el:
+            definitions.append(f"Example: {example_el.inner_text().strip()}")
+
+        explanation_el = page.query_selector("div.wotd-entry-explanation-section p")
+        if explanation_el:
+            definitions.append(explanation_el.inner_text().strip())
+
+        context.close()
+
+        if not word or len(definitions) < 1:
+            raise ValueError(f"Incomplete data — word='{word}', defs={len(definitions)}")
+
+        definitions = _pad_defs(definitions, word)
+
+        _LOG.info(f"[FETCHER] Scraped (DOM): {word} ({phonetic}), {len(definitions)} definitions")
+        return {"word": word, "phonetic": phonetic, "definitions": definitions}
+
+
+def _write_wotd_cache(path: str, word_data: dict) -> None:
+    """Atomically store today's scraped word so same-day re-runs skip the fetch,
+    and prune cache files left over from earlier days.
+    """
+    try:
+        os.makedirs(WOTD_CACHE_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_dumps_pretty(word_data))
+        os.replace(tmp_path, path)
+        for name in os.listdir(WOTD_CACHE_DIR):
+            stale_path = os.path.join(WOTD_CACHE_DIR, name)
+            if stale_path != path:
+                os.remove(stale_path)
+    except OSError as e:
+        _LOG.warning(f"[FETCHER] Could not cache today's word: {e}")
+
+
 def fetch_word_of_the_day() -> dict:
     """
-    Scrape Dictionary.com WOTD using Playwright + stealth.
+    Fetch Dictionary.com WOTD: today's cached scrape if present, else plain HTTP,
+    else Playwright + stealth.
     Returns dict with keys: word, phonetic, definitions.
     Falls back to local JSON on any failure.
     """
+    cache_path = os.path.join(WOTD_CACHE_DIR, f"{date.today().isoformat()}.json")
+    if os.path.isfile(cache_path):
+        try:
+            word_data = read_json(cache_path)
+            _LOG.info(f"[FETCHER] Using today's cached word: {word_data['word']} ({cache_path})")
+            return word_data
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            _LOG.warning(f"[FETCHER] Ignoring unusable cache file {cache_path}: {e}")
+
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
-            )
-            stealth = Stealth()
-            stealth.apply_stealth_sync(context)
-            page = context.new_page()
-            page.goto(WOTD_URL, wait_until="domcontentloaded", timeout=30000)
-            page.wait_for_timeout(3000)
-
-            # Strategy 1: Parse the embedded JSON data (most reliable)
-            json_el = page.query_selector("script#json-current-wotd")
-            if json_el:
-                import re
-                wotd_data = json.loads(json_el.inner_text())
-                word = wotd_data["headword"].strip().lower()
-                phonetic_html = wotd_data.get("pronunciation", {}).get("phonetic", {}).get("html", "")
-                phonetic = f"[{re.sub(r'<[^>]+>', '', phonetic_html)}]" if phonetic_html else ""
-                definition = wotd_data.get("definition", "")
-                pos = wotd_data.get("partOfSpeech", "")
-                definitions = []
-                if pos and definition:
-                    definitions.append(f"({pos}) {definition}")
-                elif definition:
-                    definitions.append(definition)
-
-                # Grab example sentence and explanation from top-level JSON fields
-                example_html = wotd_data.get("exampleSentence", "")
-                if example_html:
-                    example = re.sub(r'<[^>]+>', '', example_html).strip()
-                    definitions.append(f"Example: {example}")
-                body_html = wotd_data.get("body", "")
-                if body_html:
-                    explanation = re.sub(r'<[^>]+>', '', body_html).strip()
-                    definitions.append(explanation)
-
-                browser.close()
-
-                while len(definitions) < 3:
-                    definitions.append(f"Used in context: The word '{word}' enriches any sentence.")
-                definitions = definitions[:3]
-
-                print(f"[FETCHER] Scraped (JSON): {word} ({phonetic}), {len(definitions)} definitions")
-                return {"word": word, "phonetic": phonetic, "definitions": definitions}
-
-            # Strategy 2: DOM scraping fallback with current selectors
-            word_el = page.query_selector("a.wotd-entry-headword")
-            if not word_el:
-                raise ValueError("Could not locate WOTD heading element")
-            word = word_el.inner_text().strip().lower()
-
-            phonetic = ""
-            phonetic_el = page.query_selector("p.wotd-entry-phonetics")
-            if phonetic_el:
-                phonetic = phonetic_el.inner_text().strip()
-
-            definitions = []
-            def_el = page.query_selector("p.wotd-entry-definition")
-            pos_el = page.query_selector("div.wotd-entry-pos")
-            if def_el:
-                pos = pos_el.inner_text().strip() if pos_el else ""
-                defn = def_el.inner_text().strip()
-                definitions.append(f"({pos}) {defn}" if pos else defn)
-
-            example_el = page.query_selector("p.wotd-entry-example")
-            if example_el:
-                definitions.append(f"Example: {example_el.inner_text().strip()}")
-
-            explanation_el = page.query_selector("div.wotd-entry-explanation-section p")
-            if explanation_el:
-                definitions.append(explanation_el.inner_text().strip())
-
-            browser.close()
-
-            if not word or len(definitions) < 1:
-                raise ValueError(f"Incomplete data — word='{word}', defs={len(definitions)}")
-
-            while len(definitions) < 3:
-                definitions.append(f"Used in context: The word '{word}' enriches any sentence.")
-            definitions = definitions[:3]
-
-            print(f"[FETCHER] Scraped (DOM): {word} ({phonetic}), {len(definitions)} definitions")
-            return {"word": word, "phonetic": phonetic, "definitions": definitions}
+        try:
+            word_data = fetch_wotd_http()
+        except Exception as e:
+            _LOG.warning(f"[FETCHER] HTTP fast path failed: {e}")
+            word_data = None
+
+        if word_data is None:
+            _LOG.info("[FETCHER] Embedded JSON not served over plain HTTP — launching browser...")
+            word_data = fetch_wotd_playwright()
 
     except Exception as e:
-        print(f"[FETCHER] Scraping failed: {e}")
+        _LOG.error(f"[FETCHER] Scraping failed: {e}")
         send_alert(
             subject="WOTD Scraper Failed",
             body=f"The Dictionary.com scraper encountered an error:\n\n{e}\n\nFalling back to local data.",
         )
         return load_fallback()
 
+    _write_wotd_cache(cache_path, word_data)
+    return word_data
+
 
 # ── Writer ───────────────────────────────────────────────────────────────────
 
@@ -179,6 +365,9 @@ SYSTEM_PROMPT = (
     "Tone: Fast-paced, high-intelligence, slightly snarky."
 )
 
+CLAUDE_MODEL = "claude-haiku-4-5-20251001"
+SCRIPT_RETRIES = 2
+
 OUTPUT_SCHEMA = {
     "word": "string — the word of the day",
     "definitions": "list of 3 definition strings",
@@ -187,73 +376,206 @@ OUTPUT_SCHEMA = {
     "background_hex": "a dark, cinematic hex color code (e.g. #1a1a2e)",
 }
 
-
-def generate_script(word_data: dict) -> dict:
-    """Call Claude via the claude CLI to generate a video script from the WOTD data."""
-    prompt = (
-        SYSTEM_PROMPT + "\n\n"
+# Everything except the word itself is identical day to day, so it lives in a
+# cache-marked system block that Anthropic can serve from its prompt cache.
+SCRIPT_SYSTEM = [
+    {
+        "type": "text",
+        "text": (
+            SYSTEM_PROMPT + "\n\n"
+            "Return ONLY valid JSON with these exact keys:\n"
+            + json.dumps(OUTPUT_SCHEMA, indent=2)
+            + "\n\nConstraints:\n"
+            "- narration must be <= 240 characters\n"
+            "- on_screen_text must have exactly 2 items\n"
+            "- background_hex must be a dark color (value < #444444)\n"
+            "- No markdown fences, no commentary — raw JSON only."
+        ),
+        "cache_control": {"type": "ephemeral"},
+    }
+]
+
+
+def script_user_prompt(word_data: dict) -> str:
+    """The per-day part of the script prompt: just the word, phonetic and definitions."""
+    return (
         f"Word: {word_data['word']}\n"
         f"Phonetic: {word_data['phonetic']}\n"
         f"Definitions:\n"
         + "\n".join(f"  {i+1}. {d}" for i, d in enumerate(word_data["definitions"]))
-        + "\n\n"
-        "Return ONLY valid JSON with these exact keys:\n"
-        + json.dumps(OUTPUT_SCHEMA, indent=2)
-        + "\n\nConstraints:\n"
-        "- narration must be <= 240 characters\n"
-        "- on_screen_text must have exactly 2 items\n"
-        "- background_hex must be a dark color (value < #444444)\n"
-        "- No markdown fences, no commentary — raw JSON only."
     )
 
-    env = {k: v for k, v in os.environ.items() if not k.startswith(("CLAUDE", "ANTHROPIC"))}
-    result = subprocess.run(
-        ["claude", "-p", "--model", "claude-haiku-4-5-20251001"],
-        input=prompt,
-        capture_output=True,
-        text=True,
-        timeout=60,
-        env=env,
-    )
 
-    if result.returncode != 0:
-        raise RuntimeError(f"claude CLI failed (exit {result.returncode}): {result.stderr}")
+def _anthropic_client():
+    """Anthropic API client using ANTHROPIC_API_KEY from .env."""
+    from anthropic import Anthropic
+
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise RuntimeError("ANTHROPIC_API_KEY not set in .env")
+    return Anthropic(api_key=api_key, timeout=60)
+
+
+def script_request_params(word_data: dict) -> dict:
+    """messages.create() arguments for one script, shared by the interactive and batch paths."""
+    return {
+        "model": CLAUDE_MODEL,
+        "max_tokens": 1024,
+        "system": SCRIPT_SYSTEM,
+        "messages": [
+            {"role": "user", "content": script_user_prompt(word_data)},
+            # Prefill the opening brace so the reply is bare JSON — no fences to strip
+            {"role": "assistant", "content": "{"},
+        ],
+    }
+
+
+def validate_script(parsed) -> dict:
+    """Check a parsed script against the output constraints. Raises ValueError on mismatch."""
+    if not isinstance(parsed, dict):
+        raise ValueError("response must be a JSON object")
+
+    word = parsed.get("word")
+    if not isinstance(word, str):
+        raise ValueError("word must be a string")
+    definitions = parsed.get("definitions")
+    if not isinstance(definitions, list) or len(definitions) != 3:
+        raise ValueError("definitions must be a list of exactly 3 strings")
+    narration = parsed.get("narration")
+    if not isinstance(narration, str) or len(narration) > 240:
+        raise ValueError("narration must be a string of at most 240 characters")
+    on_screen_text = parsed.get("on_screen_text")
+    if not isinstance(on_screen_text, list) or len(on_screen_text) != 2:
+        raise ValueError("on_screen_text must be a list of exactly 2 items")
+    background_hex = parsed.get("background_hex")
+    if not isinstance(background_hex, str) or not background_hex.startswith("#"):
+        raise ValueError("background_hex must be a hex color string starting with '#'")
 
-    raw = result.stdout.strip()
-    # Strip markdown fences if present
-    if raw.startswith("```"):
-        raw = raw.split("\n", 1)[1]
-        if raw.endswith("```"):
-            raw = raw[: raw.rfind("```")]
-        raw = raw.strip()
+    return parsed
 
-    parsed = json.loads(raw)
 
-    # Validate
-    assert isinstance(parsed.get("word"), str), "word must be a string"
-    assert isinstance(parsed.get("definitions"), list) and len(parsed["definitions"]) == 3
-    assert isinstance(parsed.get("narration"), str) and len(parsed["narration"]) <= 240
-    assert isinstance(parsed.get("on_screen_text"), list) and len(parsed["on_screen_text"]) == 2
-    assert isinstance(parsed.get("background_hex"), str) and parsed["background_hex"].startswith("#")
+def parse_script_response(text: str) -> dict:
+    """Parse and validate Claude's (brace-prefilled) reply. Raises ValueError if unusable."""
+    return validate_script(json_loads("{" + text))
 
-    return parsed
 
+def generate_script(word_data: dict) -> dict:
+    """Call Claude via the Anthropic API to generate a video script from the WOTD data.
+    An invalid reply is sent back to Claude for correction up to SCRIPT_RETRIES times.
+    """
+    client = _anthropic_client()
+    params = script_request_params(word_data)
+
+    for attempt in range(SCRIPT_RETRIES + 1):
+        resp = client.messages.create(**params)
+        text = resp.content[0].text
+        try:
+            return parse_script_response(text)
+        except ValueError as e:
+            if attempt == SCRIPT_RETRIES:
+                raise
+            _LOG.warning(f"[WRITER] Invalid script ({e}) — asking Claude to fix it "
+                         f"(retry {attempt + 1}/{SCRIPT_RETRIES})")
+            # Replace the trailing "{" prefill with the bad reply, then ask again (prefilled anew)
+            params["messages"] = params["messages"][:-1] + [
+                {"role": "assistant", "content": "{" + text},
+                {"role": "user", "content": f"That JSON was invalid: {e}. Return raw JSON only, "
+                                            "with the exact keys and constraints given."},
+                {"role": "assistant", "content": "{"},
+            ]
+
+
+def generate_scripts_batch(word_datas: list[dict]) -> list[dict | None]:
+    """
+    Generate scripts for several words in one Message Batches job (half the per-token price).
+    Returns scripts in input order; entries that errored or failed validation are None.
+    """
+    import time
 
-# ── Phase 2: Audio Engine ─────────────────────────────────────────────────────
+    client = _anthropic_client()
+    batch = client.messages.batches.create(requests=[
+        {"custom_id": f"word-{i}", "params": script_request_params(word_data)}
+        for i, word_data in enumerate(word_datas)
+    ])
+    _LOG.info(f"[BATCH] Submitted {len(word_datas)} requests. batch_id={batch.id}")
+
+    while batch.processing_status != "ended":
+        time.sleep(BATCH_POLL_INTERVAL)
+        batch = client.messages.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        _LOG.info(f"[BATCH] {batch.processing_status}: {counts.processing} processing, "
+                  f"{counts.succeeded} succeeded, {counts.errored} errored")
+
+    scripts = [None] * len(word_datas)
+    for entry in client.messages.batches.results(batch.id):
+        index = int(entry.custom_id.removeprefix("word-"))
+        word = word_datas[index]["word"]
+        if entry.result.type != "succeeded":
+            _LOG.warning(f"[BATCH] {word}: request {entry.result.type}")
+            continue
+        try:
+            scripts[index] = parse_script_response(entry.result.message.content[0].text)
+        except ValueError as e:
+            _LOG.warning(f"[BATCH] {word}: invalid script ({e})")
+    return scripts
 
-def generate_audio() -> None:
-    """Send narration from data_bridge.json to ElevenLabs TTS (Voice: George). Save to temp/audio.mp3."""
-    from elevenlabs.client import ElevenLabs
 
+def schedule_scripts(count: int) -> None:
+    """Pre-generate scripts for the next `count` days from the local backlog words.
+    Days that already have a scheduled file are left alone, and words already
+    scheduled (or in the current data_bridge.json) are not picked again.
+    """
+    today = date.today()
+    paths = [SCHEDULED_OUTPUT_PATTERN.format(day=(today + timedelta(days=offset)).isoformat())
+             for offset in range(1, count + 1)]
+    open_paths = [path for path in paths if not os.path.exists(path)]
+    if len(open_paths) < len(paths):
+        _LOG.info(f"[BATCH] {len(paths) - len(open_paths)} of the next {count} days already scheduled — skipping them.")
+    if not open_paths:
+        return
+
+    taken = set()
+    for path in glob.glob(SCHEDULED_OUTPUT_PATTERN.format(day="*")) + [OUTPUT_PATH]:
+        try:
+            taken.add(read_json(path)["word"].lower())
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            continue
+    backlog = [w for w in read_json(FALLBACK_PATH) if w["word"].lower() not in taken]
+    if len(open_paths) > len(backlog):
+        _LOG.warning(f"[BATCH] Only {len(backlog)} unscheduled backlog words available — "
+                     f"scheduling {len(backlog)} days.")
+        open_paths = open_paths[:len(backlog)]
+    word_datas = random.sample(backlog, len(open_paths))
+
+    scripts = generate_scripts_batch(word_datas)
+
+    for path, word_data, script in zip(open_paths, word_datas, scripts):
+        if script is None:
+            continue
+        script["phonetic"] = word_data.get("phonetic", "")
+        with open(path, "wb") as f:
+            f.write(json_dumps_pretty(script))
+        _LOG.info(f"[BATCH] {script['word']} → {path}")
+
+
+# ── Phase 2: Audio Engine ─────────────────────────────────────────────────────
+
+def elevenlabs_api_key() -> str:
+    """Return ELEVENLABS_API_KEY from .env, raising if it is missing or still the placeholder."""
     api_key = os.getenv("ELEVENLABS_API_KEY")
     if not api_key or api_key == "your_elevenlabs_api_key_here":
         raise RuntimeError("ELEVENLABS_API_KEY not set in .env")
+    return api_key
+
 
-    with open(OUTPUT_PATH, "r") as f:
-        data = json.load(f)
+def generate_audio(data: dict) -> None:
+    """Send the script's narration to ElevenLabs TTS (Voice: George). Save to temp/audio.mp3."""
+    from elevenlabs.client import ElevenLabs
+
+    api_key = elevenlabs_api_key()
 
     narration = data["narration"]
-    print(f"[AUDIO] Narration ({len(narration)} chars): {narration[:80]}...")
+    _LOG.info(f"[AUDIO] Narration ({len(narration)} chars): {narration[:80]}...")
 
     client = ElevenLabs(api_key=api_key)
 
@@ -264,28 +586,56 @@ def generate_audio() -> None:
         voice_id="onwK4e9ZLuTAKqWW03F9",
         text=narration,
         model_id="eleven_multilingual_v2",
+        output_format="mp3_44100_128",  # plenty for speech; keeps FFmpeg's demux input small
     )
 
-    with open(AUDIO_PATH, "wb") as f:
+    with open(AUDIO_PATH, "wb", buffering=1 << 20) as f:  # 1 MiB: one write per ~MB of stream
         for chunk in audio_generator:
             f.write(chunk)
 
     size = os.path.getsize(AUDIO_PATH)
-    print(f"[AUDIO] Saved to {AUDIO_PATH} ({size:,} bytes)")
+    _LOG.info(f"[AUDIO] Saved to {AUDIO_PATH} ({size:,} bytes)")
 
 
 # ── Phase 2: ComfyUI Render ───────────────────────────────────────────────────
 
-def render_comfyui() -> None:
-    """Submit workflow to ComfyUI API, poll until done, download output video.
-    Output saved to temp/comfyui_raw.mp4.
+@functools.lru_cache(maxsize=1)
+def load_workflow_template() -> dict:
+    """Parse comfyui_workflow.json once; callers deepcopy before filling in the prompt."""
+    return read_json(COMFYUI_WORKFLOW_PATH)
+
+
+def cancel_comfyui_prompt(prompt_id: str) -> None:
+    """Stop a submitted prompt: interrupt it if ComfyUI is executing it, else drop it from the queue."""
+    import urllib.request
+
+    with urllib.request.urlopen(f"{COMFYUI_URL}/queue", timeout=15) as resp:
+        queue = json_loads(resp.read())
+
+    if any(item[1] == prompt_id for item in queue.get("queue_running", [])):
+        endpoint, body = "/interrupt", {"prompt_id": prompt_id}
+    else:
+        endpoint, body = "/queue", {"delete": [prompt_id]}
+    req = urllib.request.Request(
+        f"{COMFYUI_URL}{endpoint}",
+        data=json_dumps(body),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(req, timeout=15):
+        pass
+
+
+def render_comfyui(data: dict, cancel: threading.Event | None = None) -> None:
+    """Submit workflow to ComfyUI API, wait on its websocket until done, download output video.
+    Output saved to temp/comfyui_raw.mp4. Setting `cancel` (checked about once a second)
+    interrupts the ComfyUI job and makes this raise.
     """
     import time
     import urllib.request
     import urllib.parse
+    import uuid
 
-    with open(OUTPUT_PATH, "r") as f:
-        data = json.load(f)
+    import websocket  # websocket-client
 
     word = data["word"]
     phonetic = data.get("phonetic", "")
@@ -299,69 +649,91 @@ def render_comfyui() -> None:
         f"warm natural window light, shallow depth of field, photorealistic, 4k, high detail"
     )
 
-    with open(COMFYUI_WORKFLOW_PATH, "r") as f:
-        workflow_template = f.read()
+    workflow = copy.deepcopy(load_workflow_template())
+    workflow[COMFYUI_PROMPT_NODE]["inputs"]["text"] = prompt_text
 
-    escaped_prompt = prompt_text.replace("\\", "\\\\").replace('"', '\\"')
-    workflow_json = workflow_template.replace("{{PROMPT_TEXT}}", escaped_prompt)
-    workflow = json.loads(workflow_json)
-
-    payload = json.dumps({"prompt": workflow}).encode("utf-8")
-    req = urllib.request.Request(
-        f"{COMFYUI_URL}/prompt",
-        data=payload,
-        headers={"Content-Type": "application/json"},
-    )
+    # Subscribe to ComfyUI's event stream *before* queueing so no events for this prompt are missed
+    client_id = uuid.uuid4().hex
+    ws = websocket.WebSocket()
+    ws.connect(f"{COMFYUI_WS_URL}/ws?clientId={client_id}", timeout=30)
+    try:
+        payload = json_dumps({"prompt": workflow, "client_id": client_id})
+        req = urllib.request.Request(
+            f"{COMFYUI_URL}/prompt",
+            data=payload,
+            headers={"Content-Type": "application/json"},
+        )
 
-    print(f"[COMFYUI] Submitting workflow for word: {word}")
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        result = json.loads(resp.read())
+        _LOG.info(f"[COMFYUI] Submitting workflow for word: {word}")
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            result = json_loads(resp.read())
+
+        prompt_id = result.get("prompt_id")
+        if not prompt_id:
+            raise RuntimeError(f"ComfyUI did not return a prompt_id: {result}")
+        _LOG.info(f"[COMFYUI] Queued. prompt_id={prompt_id}")
+
+        max_wait = 1800  # 30 minutes (Wan I2V is slow on Apple Silicon)
+        start = time.monotonic()
+        while True:
+            if cancel is not None and cancel.is_set():
+                _LOG.warning(f"[COMFYUI] Cancelling prompt {prompt_id} — another stage failed.")
+                cancel_comfyui_prompt(prompt_id)
+                raise RuntimeError("ComfyUI render cancelled")
+            remaining = max_wait - (time.monotonic() - start)
+            if remaining <= 0:
+                raise RuntimeError(f"ComfyUI job did not complete within {max_wait}s")
+            ws.settimeout(min(remaining, 1.0))  # short slices so `cancel` is noticed promptly
+            try:
+                frame = ws.recv()
+            except websocket.WebSocketTimeoutException:
+                continue
+
+            if not isinstance(frame, str):
+                continue  # binary frames are latent previews
+
+            event = json_loads(frame)
+            event_data = event.get("data", {})
+            if event_data.get("prompt_id") != prompt_id:
+                continue
+
+            elapsed = int(time.monotonic() - start)
+            if event["type"] == "execution_error":
+                raise RuntimeError(f"ComfyUI job failed: {event_data.get('exception_message', event_data)}")
+            if event["type"] == "executing":
+                if event_data.get("node") is None:  # ComfyUI's "prompt finished" signal
+                    break
+                _LOG.info(f"[COMFYUI] Running node {event_data['node']}... ({elapsed}s elapsed)")
+    finally:
+        ws.close()
+
+    # The finish event can race ComfyUI's history write by a moment, so allow a few quick retries
+    for _ in range(5):
+        with urllib.request.urlopen(f"{COMFYUI_URL}/history/{prompt_id}", timeout=15) as resp:
+            history = json_loads(resp.read())
+        if prompt_id in history:
+            break
+        time.sleep(1)
 
-    prompt_id = result.get("prompt_id")
-    if not prompt_id:
-        raise RuntimeError(f"ComfyUI did not return a prompt_id: {result}")
-    print(f"[COMFYUI] Queued. prompt_id={prompt_id}")
+    job = history.get(prompt_id, {})
+    status = job.get("status", {})
+    if status.get("status_str") == "error":
+        raise RuntimeError(f"ComfyUI job failed: {status.get('messages', [])}")
 
-    poll_interval = 10
-    max_wait = 1800  # 30 minutes (Wan I2V is slow on Apple Silicon)
-    elapsed = 0
     output_filename = None
     output_subfolder = ""
-
-    while elapsed < max_wait:
-        time.sleep(poll_interval)
-        elapsed += poll_interval
-
-        with urllib.request.urlopen(f"{COMFYUI_URL}/history/{prompt_id}", timeout=15) as resp:
-            history = json.loads(resp.read())
-
-        if prompt_id not in history:
-            print(f"[COMFYUI] Waiting... ({elapsed}s elapsed)")
-            continue
-
-        job = history[prompt_id]
-        status = job.get("status", {})
-
-        if status.get("status_str") == "error":
-            raise RuntimeError(f"ComfyUI job failed: {status.get('messages', [])}")
-
-        outputs = job.get("outputs", {})
-        for node_id, node_output in outputs.items():
-            for file_entry in node_output.get("videos", []):
-                output_filename = file_entry["filename"]
-                output_subfolder = file_entry.get("subfolder", "")
-                break
-            if output_filename:
-                break
-
+    outputs = job.get("outputs", {})
+    for node_id, node_output in outputs.items():
+        for file_entry in node_output.get("videos", []):
+            output_filename = file_entry["filename"]
+            output_subfolder = file_entry.get("subfolder", "")
+            break
         if output_filename:
-            print(f"[COMFYUI] Done after {elapsed}s. Output: {output_filename}")
             break
 
-        print(f"[COMFYUI] Still running... ({elapsed}s elapsed)")
-
     if not output_filename:
-        raise RuntimeError(f"ComfyUI job did not complete within {max_wait}s")
+        raise RuntimeError(f"ComfyUI job finished without a video output: {outputs}")
+    _LOG.info(f"[COMFYUI] Done after {elapsed}s. Output: {output_filename}")
 
     params = urllib.parse.urlencode({
         "filename": output_filename,
@@ -371,73 +743,186 @@ def render_comfyui() -> None:
     download_url = f"{COMFYUI_URL}/view?{params}"
 
     os.makedirs(TEMP_DIR, exist_ok=True)
-    print(f"[COMFYUI] Downloading output video...")
-    urllib.request.urlretrieve(download_url, COMFYUI_VIDEO_PATH)
+    _LOG.info(f"[COMFYUI] Downloading output video...")
+    download_req = urllib.request.Request(download_url, headers={"Accept-Encoding": "identity"})
+    with urllib.request.urlopen(download_req, timeout=60) as resp, open(COMFYUI_VIDEO_PATH, "wb") as f:
+        shutil.copyfileobj(resp, f, length=1 << 20)  # stream in 1 MiB blocks
 
     size = os.path.getsize(COMFYUI_VIDEO_PATH)
-    print(f"[COMFYUI] Saved to {COMFYUI_VIDEO_PATH} ({size:,} bytes)")
+    _LOG.info(f"[COMFYUI] Saved to {COMFYUI_VIDEO_PATH} ({size:,} bytes)")
 
 
 # ── Phase 2: FFmpeg Merge ─────────────────────────────────────────────────────
 
-def merge_video() -> None:
-    """Loop ComfyUI video clip and merge with ElevenLabs audio into final MP4."""
+def encode_audio() -> subprocess.Popen:
+    """Start transcoding temp/audio.mp3 to AAC (temp/audio.m4a) in the background.
+    Runs while ComfyUI is still rendering, so the final merge only has to remux the audio.
+    """
+    _LOG.info("[FFMPEG] Pre-encoding narration to AAC in the background...")
+    return subprocess.Popen(
+        [
+            "ffmpeg", "-y", "-nostats", "-loglevel", "error",
+            "-i", AUDIO_PATH,
+            "-vn",
+            "-c:a", "aac",
+            "-b:a", "192k",
+            AUDIO_AAC_PATH,
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+
+def probe_video_stream(path: str) -> tuple[str, str]:
+    """Return (codec_name, pix_fmt) of the first video stream, or ("", "") if ffprobe fails."""
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-select_streams", "v:0",
+                "-show_entries", "stream=codec_name,pix_fmt",
+                "-of", "json",
+                path,
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return "", ""
+    if result.returncode != 0:
+        return "", ""
+    streams = json_loads(result.stdout).get("streams") or [{}]
+    return streams[0].get("codec_name", ""), streams[0].get("pix_fmt", "")
+
+
+def merge_video(aac_proc: subprocess.Popen) -> None:
+    """Loop ComfyUI video clip and merge with the pre-encoded AAC narration into final MP4."""
     os.makedirs(EXPORTS_DIR, exist_ok=True)
 
+    try:
+        _, aac_stderr = aac_proc.communicate(timeout=120)
+    except subprocess.TimeoutExpired:
+        aac_proc.kill()
+        aac_proc.communicate()  # reap it so no zombie ffmpeg is left behind
+        raise
+    if aac_proc.returncode != 0:
+        _LOG.error(f"[FFMPEG] stderr: {aac_stderr}")
+        raise RuntimeError(f"FFmpeg AAC encode failed (exit code {aac_proc.returncode})")
+
+    codec, pix_fmt = probe_video_stream(COMFYUI_VIDEO_PATH)
+    if (codec, pix_fmt) == ("h264", "yuv420p"):
+        # ComfyUI already produced a social-ready stream: remux instead of re-encoding
+        _LOG.info("[FFMPEG] ComfyUI clip is H.264/yuv420p — stream-copying video.")
+        global_args = []
+        video_args = ["-c:v", "copy"]
+    else:
+        _LOG.info(f"[FFMPEG] ComfyUI clip is {codec or 'unknown'}/{pix_fmt or 'unknown'} — re-encoding to HEVC.")
+        global_args = ["-filter_threads", str(os.cpu_count() or 1)]
+        video_args = [
+            "-threads", "0",
+            "-c:v", "hevc_videotoolbox", # Apple Silicon hardware encoder
+            "-tag:v", "hvc1",            # QuickTime/iOS-playable HEVC tag
+            "-q:v", "55",
+            "-pix_fmt", "yuv420p",
+        ]
+
     ffmpeg_cmd = [
         "ffmpeg", "-y",
+        *global_args,
         "-stream_loop", "-1",        # loop short ComfyUI clip indefinitely
         "-i", COMFYUI_VIDEO_PATH,
-        "-i", AUDIO_PATH,
-        "-c:v", "h264_videotoolbox", # Apple Silicon hardware encoder
-        "-b:v", "8000k",
-        "-pix_fmt", "yuv420p",
-        "-c:a", "aac",
-        "-b:a", "192k",
+        "-i", AUDIO_AAC_PATH,
+        *video_args,
+        "-c:a", "copy",              # already AAC — see encode_audio()
         "-shortest",                 # trim at end of audio track
         "-movflags", "+faststart",
         EXPORT_PATH,
     ]
 
-    print("[FFMPEG] Merging ComfyUI video + audio...")
+    _LOG.info("[FFMPEG] Merging ComfyUI video + audio...")
     result = subprocess.run(ffmpeg_cmd, capture_output=True, text=True, timeout=120)
 
     if result.returncode != 0:
-        print(f"[FFMPEG] stderr: {result.stderr}")
+        _LOG.error(f"[FFMPEG] stderr: {result.stderr}")
         raise RuntimeError(f"FFmpeg merge failed (exit code {result.returncode})")
 
     size = os.path.getsize(EXPORT_PATH)
-    print(f"[FFMPEG] Output: {EXPORT_PATH} ({size:,} bytes / {size / 1_048_576:.1f} MB)")
+    _LOG.info(f"[FFMPEG] Output: {EXPORT_PATH} ({size:,} bytes / {size / 1_048_576:.1f} MB)")
 
 
 # ── Phase 2: Cleanup Manager ─────────────────────────────────────────────────
 
 def cleanup() -> None:
-    """Delete temp/ only if exports/word_of_the_day.mp4 exists and is > 1MB."""
+    """Delete the Phase 2 temp files only if exports/word_of_the_day.mp4 exists and is > 1MB.
+    The per-day WOTD cache is kept so a same-day re-run can still skip the scrape.
+    """
     if not os.path.isfile(EXPORT_PATH):
-        print("[CLEANUP] Skipped — export file not found.")
+        _LOG.info("[CLEANUP] Skipped — export file not found.")
         return
 
     size = os.path.getsize(EXPORT_PATH)
     if size < 1_048_576:
-        print(f"[CLEANUP] Skipped — export is only {size:,} bytes (< 1MB).")
+        _LOG.info(f"[CLEANUP] Skipped — export is only {size:,} bytes (< 1MB).")
         return
 
-    shutil.rmtree(TEMP_DIR, ignore_errors=True)
-    print(f"[CLEANUP] Removed {TEMP_DIR}/ (export verified: {size:,} bytes)")
+    for path in (AUDIO_PATH, AUDIO_AAC_PATH, COMFYUI_VIDEO_PATH):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            _LOG.warning(f"[CLEANUP] Could not remove {path}: {e}")
+
+    try:
+        os.rmdir(TEMP_DIR)
+        _LOG.info(f"[CLEANUP] Removed {TEMP_DIR}/ (export verified: {size:,} bytes)")
+    except OSError:
+        # Still holds the WOTD day cache (or something unexpected) — leave it in place
+        _LOG.info(f"[CLEANUP] Removed temp files; kept {TEMP_DIR}/ contents: {sorted(os.listdir(TEMP_DIR))}")
 
 
 # ── Main ─────────────────────────────────────────────────────────────────────
 
+def configure_logging(level: int = logging.INFO) -> None:
+    """Send pipeline logs to stderr; logging's handler lock keeps concurrent lines whole."""
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s", "%H:%M:%S"))
+    _LOG.addHandler(handler)
+    _LOG.setLevel(level)
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
+    configure_logging()
     parser = argparse.ArgumentParser(description="Word of the Day Pipeline")
     parser.add_argument(
         "--test", action="store_true",
         help="Test mode: skip Claude and ElevenLabs API calls, reuse cached data_bridge.json and temp/audio.mp3",
     )
+    parser.add_argument(
+        "--batch", type=positive_int, metavar="N",
+        help="Pre-generate scripts for the next N days from local backlog words via the "
+             "Message Batches API, write data_bridge_YYYY-MM-DD.json files, and exit",
+    )
     args = parser.parse_args()
 
+    if args.batch is not None:
+        schedule_scripts(args.batch)
+        return
+
     test_mode = args.test
+    scheduled_path = SCHEDULED_OUTPUT_PATTERN.format(day=date.today().isoformat())
 
     print("=" * 60)
     print("  WORD OF THE DAY PIPELINE — Phase 1 & 2")
@@ -449,38 +934,70 @@ def main():
     if test_mode:
         if not os.path.isfile(OUTPUT_PATH):
             raise RuntimeError(f"Test mode requires existing {OUTPUT_PATH}")
-        print(f"\n[1/5] Skipping fetch — using cached {OUTPUT_PATH}")
-        print(f"\n[2/5] Skipping Claude — using cached {OUTPUT_PATH}")
-        with open(OUTPUT_PATH, "r") as f:
-            script = json.load(f)
-        print(json.dumps(script, indent=2))
+        _LOG.info(f"[1/5] Skipping fetch — using cached {OUTPUT_PATH}")
+        _LOG.info(f"[2/5] Skipping Claude — using cached {OUTPUT_PATH}")
+        script = read_json(OUTPUT_PATH)
+        print(json_dumps_pretty(script).decode())
+    elif os.path.isfile(scheduled_path):
+        _LOG.info(f"[1/5] Skipping fetch — script pre-generated in {scheduled_path}")
+        _LOG.info(f"[2/5] Skipping Claude — using {scheduled_path}")
+        script = read_json(scheduled_path)
     else:
-        print("\n[1/5] Fetching Word of the Day...")
+        _LOG.info("[1/5] Fetching Word of the Day...")
         word_data = fetch_word_of_the_day()
 
-        print("\n[2/5] Generating script via Claude...")
+        _LOG.info("[2/5] Generating script via Claude...")
         script = generate_script(word_data)
         script["phonetic"] = word_data.get("phonetic", "")
 
-        with open(OUTPUT_PATH, "w") as f:
-            json.dump(script, f, indent=2)
-        print(f"[DONE] Output saved to {OUTPUT_PATH}")
-        print(json.dumps(script, indent=2))
+    if not test_mode:
+        script_json = json_dumps_pretty(script)
+        with open(OUTPUT_PATH, "wb") as f:
+            f.write(script_json)
+        _LOG.info(f"[DONE] Output saved to {OUTPUT_PATH}")
+        print(script_json.decode())
 
     # ── Phase 2 ──
-    if test_mode:
-        if not os.path.isfile(AUDIO_PATH):
-            raise RuntimeError(f"Test mode requires existing {AUDIO_PATH}")
-        print(f"\n[3/5] Skipping TTS — using cached {AUDIO_PATH}")
-    else:
-        print("\n[3/5] Generating TTS audio via ElevenLabs...")
-        generate_audio()
-
-    print("\n[4/5] Generating video via ComfyUI API...")
-    render_comfyui()
-
-    print("\n[5/5] Merging ComfyUI video + audio via FFmpeg (Apple Silicon)...")
-    merge_video()
+    # TTS and the ComfyUI render share no data until the merge, so run them side by side.
+    if not test_mode:
+        elevenlabs_api_key()  # fail before queueing a long ComfyUI render, not after
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    cancel_render = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=2)
+    aac_proc = None
+    try:
+        if test_mode:
+            if not os.path.isfile(AUDIO_PATH):
+                raise RuntimeError(f"Test mode requires existing {AUDIO_PATH}")
+            _LOG.info(f"[3/5] Skipping TTS — using cached {AUDIO_PATH}")
+            audio_future = None
+            aac_proc = encode_audio()
+        else:
+            _LOG.info("[3/5] Generating TTS audio via ElevenLabs (in parallel with render)...")
+            audio_future = executor.submit(generate_audio, script)
+
+        _LOG.info("[4/5] Generating video via ComfyUI API...")
+        render_future = executor.submit(render_comfyui, script, cancel_render)
+
+        futures = [f for f in (audio_future, render_future) if f is not None]
+        for future in as_completed(futures):
+            future.result()
+            if future is audio_future:
+                aac_proc = encode_audio()  # overlaps the rest of the render
+    except BaseException:
+        if aac_proc is not None:  # the merge won't run, so don't leave the encode behind
+            aac_proc.kill()
+            aac_proc.communicate()
+        raise
+    finally:
+        # On any abnormal exit (stage failure, Ctrl-C, SystemExit) the render sees
+        # cancel_render within ~1 s and interrupts its ComfyUI job; after success it
+        # has already returned. Either way the wait below is short.
+        cancel_render.set()
+        executor.shutdown(wait=True)
+
+    _LOG.info("[5/5] Merging ComfyUI video + audio via FFmpeg (Apple Silicon)...")
+    merge_video(aac_proc)
 
     # Cleanup
     cleanup()